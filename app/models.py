@@ -1,6 +1,13 @@
-from sqlmodel import SQLModel, Field
-from datetime import datetime
-from typing import Optional
+from sqlmodel import SQLModel, Field, Index
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+DISPLAY_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime, matching the timezone-less timestamp columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 # Persistent models (stored in database)
@@ -10,9 +17,12 @@ class Todo(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=200)
     description: str = Field(default="", max_length=1000)
-    completed: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    completed: bool = Field(default=False, index=True)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
+
+    # Serves the newest-first ordering and keyset pagination of the todo list
+    __table_args__ = (Index("ix_todos_created_at_id", "created_at", "id"),)
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
@@ -45,3 +55,40 @@ class TodoResponse(SQLModel, table=False):
             created_at=todo.created_at.isoformat(),
             updated_at=todo.updated_at.isoformat(),
         )
+
+
+# Lightweight read-only row for list rendering. Skips pydantic validation since the data comes from the database.
+class TodoRow(NamedTuple):
+    id: int
+    title: str
+    description: str
+    completed: bool
+    created_at: datetime
+    updated_at: datetime
+    # created_at formatted for display once, so re-rendering a card does not format it again
+    created_display: str
+
+    @classmethod
+    def from_columns(
+        cls, id: int, title: str, description: str, completed: bool, created_at: datetime, updated_at: datetime
+    ) -> "TodoRow":
+        return cls(
+            id,
+            title,
+            description,
+            completed,
+            created_at,
+            updated_at,
+            created_at.strftime(DISPLAY_DATETIME_FORMAT),
+        )
+
+    @classmethod
+    def from_response(cls, response: TodoResponse) -> "TodoRow":
+        return cls.from_columns(
+            response.id,
+            response.title,
+            response.description,
+            response.completed,
+            datetime.fromisoformat(response.created_at),
+            datetime.fromisoformat(response.updated_at),
+        )
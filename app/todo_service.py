@@ -1,20 +1,59 @@
-from datetime import datetime
-from typing import Optional
-from sqlmodel import select, desc
+import threading
+from typing import Any, Optional, cast
+from sqlalchemy import CursorResult, event, literal, select as sa_select, tuple_
+from sqlmodel import SQLModel, select, delete, desc, func, col
 from app.database import get_session
-from app.models import Todo, TodoCreate, TodoUpdate, TodoResponse
+from app.models import Todo, TodoCreate, TodoUpdate, TodoResponse, TodoRow, utc_now
+
+# Number of todos returned per page of the todo list
+TODO_PAGE_SIZE = 50
+
+# Process-local stats cache, invalidated on every write that can change the counts.
+# The version counter keeps a query that raced with a write from caching stale counts.
+_stats_cache: Optional[dict[str, int]] = None
+_stats_version = 0
+_stats_lock = threading.Lock()
+
+
+def _invalidate_stats_cache() -> None:
+    global _stats_cache, _stats_version
+    with _stats_lock:
+        _stats_cache = None
+        _stats_version += 1
+
+
+# Dropping or recreating the table (e.g. reset_db) also changes the counts
+_todo_table = SQLModel.metadata.tables["todos"]
+event.listen(_todo_table, "after_create", lambda *args, **kwargs: _invalidate_stats_cache())
+event.listen(_todo_table, "after_drop", lambda *args, **kwargs: _invalidate_stats_cache())
 
 
 class TodoService:
     """Service layer for todo operations."""
 
     @staticmethod
-    def get_all_todos() -> list[TodoResponse]:
-        """Get all todos ordered by creation date (newest first)."""
+    def get_all_todos(limit: int = TODO_PAGE_SIZE, before: Optional[TodoRow] = None) -> list[TodoRow]:
+        """Get a page of todos ordered by creation date (newest first).
+
+        Pass the last todo of the previous page as `before` to get the next page.
+        """
         with get_session() as session:
-            statement = select(Todo).order_by(desc(Todo.created_at))
-            todos = session.exec(statement).all()
-            return [TodoResponse.from_todo(todo) for todo in todos]
+            # Select plain columns so no ORM instances are built for rows that are only rendered
+            statement = sa_select(
+                col(Todo.id),
+                col(Todo.title),
+                col(Todo.description),
+                col(Todo.completed),
+                col(Todo.created_at),
+                col(Todo.updated_at),
+            )
+            # Keyset pagination: unlike an offset, it does not skip rows when earlier ones are deleted
+            if before is not None:
+                statement = statement.where(
+                    tuple_(col(Todo.created_at), col(Todo.id)) < tuple_(literal(before.created_at), literal(before.id))
+                )
+            statement = statement.order_by(desc(Todo.created_at), desc(Todo.id)).limit(limit)
+            return [TodoRow.from_columns(*row) for row in session.execute(statement)]
 
     @staticmethod
     def get_todo_by_id(todo_id: int) -> Optional[TodoResponse]:
@@ -29,16 +68,18 @@ class TodoService:
     def create_todo(todo_data: TodoCreate) -> TodoResponse:
         """Create a new todo."""
         with get_session() as session:
+            now = utc_now()
             todo = Todo(
                 title=todo_data.title,
                 description=todo_data.description,
                 completed=False,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
             )
             session.add(todo)
             session.commit()
             session.refresh(todo)
+            _invalidate_stats_cache()
             return TodoResponse.from_todo(todo)
 
     @staticmethod
@@ -54,14 +95,18 @@ class TodoService:
                 todo.title = todo_data.title
             if todo_data.description is not None:
                 todo.description = todo_data.description
+            completed_changed = todo_data.completed is not None and todo_data.completed != todo.completed
             if todo_data.completed is not None:
                 todo.completed = todo_data.completed
 
-            todo.updated_at = datetime.utcnow()
-            session.add(todo)
+            todo.updated_at = utc_now()
+            # Build the response before committing: the todo is already tracked and up to date,
+            # while committing expires its attributes and reading them back would re-SELECT the row
+            response = TodoResponse.from_todo(todo)
             session.commit()
-            session.refresh(todo)
-            return TodoResponse.from_todo(todo)
+            if completed_changed:
+                _invalidate_stats_cache()
+            return response
 
     @staticmethod
     def toggle_todo_completion(todo_id: int) -> Optional[TodoResponse]:
@@ -72,31 +117,42 @@ class TodoService:
                 return None
 
             todo.completed = not todo.completed
-            todo.updated_at = datetime.utcnow()
-            session.add(todo)
+            todo.updated_at = utc_now()
+            response = TodoResponse.from_todo(todo)
             session.commit()
-            session.refresh(todo)
-            return TodoResponse.from_todo(todo)
+            _invalidate_stats_cache()
+            return response
 
     @staticmethod
     def delete_todo(todo_id: int) -> bool:
         """Delete a todo by ID. Returns True if deleted, False if not found."""
         with get_session() as session:
-            todo = session.get(Todo, todo_id)
-            if todo is None:
+            # Single DELETE statement; the affected row count tells whether the todo existed
+            result = cast(CursorResult[Any], session.execute(delete(Todo).where(col(Todo.id) == todo_id)))
+            session.commit()
+            if result.rowcount == 0:
                 return False
 
-            session.delete(todo)
-            session.commit()
+            _invalidate_stats_cache()
             return True
 
     @staticmethod
     def get_stats() -> dict[str, int]:
-        """Get basic statistics about todos."""
+        """Get basic statistics about todos (cached until the next write)."""
+        global _stats_cache
+        with _stats_lock:
+            if _stats_cache is not None:
+                return dict(_stats_cache)
+            version = _stats_version
+
         with get_session() as session:
-            all_todos = session.exec(select(Todo)).all()
-            total = len(all_todos)
-            completed = sum(1 for todo in all_todos if todo.completed)
+            # Count server-side in a single query instead of loading every row
+            statement = select(func.count(), func.count().filter(col(Todo.completed))).select_from(Todo)
+            total, completed = session.exec(statement).one()
             pending = total - completed
 
-            return {"total": total, "completed": completed, "pending": pending}
+        stats = {"total": total, "completed": completed, "pending": pending}
+        with _stats_lock:
+            if version == _stats_version:
+                _stats_cache = stats
+        return dict(stats)
@@ -1,10 +1,63 @@
 import logging
-from nicegui import ui
-from app.todo_service import TodoService
-from app.models import TodoCreate
+from dataclasses import dataclass
+from html import escape
+from typing import Awaitable, Callable, Optional
+from nicegui import run, ui
+from app.todo_service import TODO_PAGE_SIZE, TodoService
+from app.models import TodoCreate, TodoResponse, TodoRow, utc_now
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between two stats refreshes
+STATS_REFRESH_INTERVAL = 0.25
+
+# Id of optimistic placeholder todos that have not been saved yet
+PENDING_TODO_ID = -1
+
+TodoHandler = Callable[[TodoRow], Awaitable[None]]
+
+# Styling shared by all todo cards, added once when a card is created
+TODO_CARD_BASE_CLASSES = "p-4 rounded-xl shadow-md hover:shadow-lg transition-shadow border-l-4"
+# State-dependent styling, computed once instead of per rendered todo
+TODO_CARD_CLASSES = {
+    True: "bg-green-50 border-green-400",
+    False: "bg-white border-blue-400",
+}
+TODO_TITLE_CLASSES = {
+    True: "text-lg font-semibold text-green-700 line-through",
+    False: "text-lg font-semibold text-gray-800",
+}
+TODO_DESCRIPTION_CLASSES = {
+    True: "text-sm text-green-600 line-through",
+    False: "text-sm text-gray-600",
+}
+# Toggle button icon, color and tooltip
+TODO_TOGGLE_BUTTON = {
+    True: ("undo", "orange", "Undo"),
+    False: ("check_circle", "positive", "Complete"),
+}
+
+
+@dataclass
+class TodoCard:
+    """Handles to the elements of a rendered todo, so updates only touch what changed."""
+
+    todo: TodoRow
+    card: ui.card
+    content: ui.html
+    toggle_button: ui.button
+    toggle_tooltip: ui.tooltip
+
+
+@dataclass
+class StatsCards:
+    """Value labels of the statistics cards, updated in place on refresh."""
+
+    total: ui.label
+    completed: ui.label
+    pending: ui.label
+    error: ui.label
+
 
 def create():
     """Create the todo application UI."""
@@ -26,21 +79,69 @@ def create():
 
         # Container for the entire app
         with ui.column().classes("max-w-2xl mx-auto p-6 gap-6"):
-            # Add new todo form
-            create_add_todo_form()
+            # Card handles keyed by todo id, used for in-place updates
+            todo_cards: dict[int, TodoCard] = {}
+            # Column holding the cards of the current list, saved todos are inserted at its top
+            list_column: Optional[ui.column] = None
+
+            @ui.refreshable
+            def todo_list_section():
+                nonlocal list_column
+                list_column = load_todo_list(todo_cards, on_toggle=handle_toggle, on_delete=handle_delete)
+
+            def refresh_stats_now():
+                stats_refresh_timer.deactivate()
+                load_stats(stats_cards)
+
+            # Writes only activate the timer, so bursts of clicks coalesce into at most one stats query per tick
+            stats_refresh_timer = ui.timer(STATS_REFRESH_INTERVAL, refresh_stats_now, active=False)
+
+            async def handle_add(todo_data: TodoCreate) -> bool:
+                result = await create_new_todo(todo_data, pending_column)
+                if result is None:
+                    return False
+                stats_refresh_timer.activate()
+                if list_column is None or not todo_cards:
+                    # Replace the empty state (or a failed load) with the list
+                    todo_list_section.refresh()
+                else:
+                    # Insert only the new card, so pages loaded with "Load more" stay in place
+                    with list_column:
+                        item = create_todo_item(TodoRow.from_response(result), handle_toggle, handle_delete)
+                    item.card.move(target_index=0)
+                    todo_cards[result.id] = item
+                return True
+
+            async def handle_toggle(todo: TodoRow):
+                toggled = await toggle_todo_completion(todo, todo_cards)
+                after_card_change(todo, changed=toggled)
+
+            async def handle_delete(todo: TodoRow):
+                deleted = await delete_todo(todo, todo_cards)
+                after_card_change(todo, changed=deleted)
+
+            def after_card_change(todo: TodoRow, changed: bool):
+                # A card is also dropped when its todo turns out to be deleted elsewhere, which changes the counts too
+                if changed or todo.id not in todo_cards:
+                    stats_refresh_timer.activate()
+                # Show the empty state once the last todo is gone
+                if not todo_cards:
+                    todo_list_section.refresh()
 
-            # Stats section
-            stats_container = ui.column().classes("gap-2")
+            # Add new todo form
+            create_add_todo_form(on_add=handle_add)
 
-            # Todo list container
-            todo_list_container = ui.column().classes("gap-3")
+            # Stats section, built once; refreshes only update the values
+            stats_cards = create_stats_section()
+            load_stats(stats_cards)
 
-            # Initial load
-            load_stats(stats_container)
-            load_todo_list(todo_list_container)
+            # Todo list, preceded by placeholders for todos that are still being saved
+            with ui.column().classes("gap-3 w-full"):
+                pending_column = ui.column().classes("gap-3 w-full empty:hidden")
+                todo_list_section()
 
 
-def create_add_todo_form():
+def create_add_todo_form(on_add: Callable[[TodoCreate], Awaitable[bool]]):
     """Create the form for adding new todos."""
     with ui.card().classes("p-6 shadow-lg rounded-xl bg-white"):
         ui.label("Add New Todo").classes("text-xl font-semibold text-gray-700 mb-4")
@@ -53,13 +154,15 @@ def create_add_todo_form():
             )
 
         with ui.row().classes("gap-2 justify-end mt-4"):
-            ui.button("Add Todo", on_click=lambda: add_new_todo(title_input, description_input)).classes(
+            ui.button("Add Todo", on_click=lambda: add_new_todo(title_input, description_input, on_add)).classes(
                 "bg-primary text-white px-6 py-2 rounded-lg hover:bg-blue-600"
             )
 
 
-def add_new_todo(title_input: ui.input, description_input: ui.textarea):
-    """Add a new todo and refresh the display."""
+async def add_new_todo(
+    title_input: ui.input, description_input: ui.textarea, on_add: Callable[[TodoCreate], Awaitable[bool]]
+):
+    """Validate the form, clear it and add the new todo."""
     title = title_input.value.strip() if title_input.value else ""
     description = description_input.value.strip() if description_input.value else ""
 
@@ -69,146 +172,282 @@ def add_new_todo(title_input: ui.input, description_input: ui.textarea):
 
     try:
         todo_data = TodoCreate(title=title, description=description)
-        TodoService.create_todo(todo_data)
+    except Exception as e:
+        logger.error(f"Error adding todo: {str(e)}")
+        ui.notify(f"Error adding todo: {str(e)}", type="negative")
+        return
+
+    # Clear form right away, the todo is shown while it is being saved
+    title_input.set_value("")
+    description_input.set_value("")
 
-        # Clear form
-        title_input.set_value("")
-        description_input.set_value("")
+    if not await on_add(todo_data):
+        # Restore the input so it is not lost
+        title_input.set_value(title)
+        description_input.set_value(description)
 
-        # Refresh the page to show changes
-        ui.navigate.reload()
 
+async def create_new_todo(todo_data: TodoCreate, pending_column: ui.column) -> Optional[TodoResponse]:
+    """Show a placeholder for the new todo, then save it. Returns the saved todo, or None on failure."""
+    with pending_column:
+        placeholder = create_todo_item(pending_todo_row(todo_data))
+
+    try:
+        result = await run.io_bound(TodoService.create_todo, todo_data)
         ui.notify("Todo added successfully!", type="positive")
+        return result
 
     except Exception as e:
         logger.error(f"Error adding todo: {str(e)}")
         ui.notify(f"Error adding todo: {str(e)}", type="negative")
+        return None
+
+    finally:
+        # Replaced by the card of the saved todo, or dropped on failure
+        placeholder.card.delete()
 
 
-def load_stats(container: ui.column):
-    """Load and display statistics."""
+def pending_todo_row(todo_data: TodoCreate) -> TodoRow:
+    """Build a placeholder row for a todo that has not been saved yet."""
+    now = utc_now()
+    return TodoRow.from_columns(
+        PENDING_TODO_ID,
+        todo_data.title,
+        todo_data.description,
+        False,
+        now,
+        now,
+    )
+
+
+def create_stats_section() -> StatsCards:
+    """Create the statistics cards, without values yet."""
+    with ui.row().classes("gap-4 w-full justify-center"):
+        total = create_stat_card("Total", "text-blue-600")
+        completed = create_stat_card("Completed", "text-green-600")
+        pending = create_stat_card("Pending", "text-orange-600")
+
+    error = ui.label().classes("text-red-500")
+    error.set_visibility(False)
+    return StatsCards(total, completed, pending, error)
+
+
+def load_stats(stats_cards: StatsCards):
+    """Load statistics into the existing stat cards."""
     try:
         stats = TodoService.get_stats()
 
-        with container:
-            with ui.row().classes("gap-4 w-full justify-center"):
-                create_stat_card("Total", str(stats["total"]), "text-blue-600")
-                create_stat_card("Completed", str(stats["completed"]), "text-green-600")
-                create_stat_card("Pending", str(stats["pending"]), "text-orange-600")
+        stats_cards.total.set_text(str(stats["total"]))
+        stats_cards.completed.set_text(str(stats["completed"]))
+        stats_cards.pending.set_text(str(stats["pending"]))
+        stats_cards.error.set_visibility(False)
 
     except Exception as e:
         logger.error(f"Error loading stats: {str(e)}")
-        with container:
-            ui.label(f"Error loading stats: {str(e)}").classes("text-red-500")
+        stats_cards.error.set_text(f"Error loading stats: {str(e)}")
+        stats_cards.error.set_visibility(True)
 
 
-def create_stat_card(label: str, value: str, color_class: str):
-    """Create a small statistics card."""
+def create_stat_card(label: str, color_class: str) -> ui.label:
+    """Create a small statistics card and return its value label."""
     with ui.card().classes("p-4 text-center bg-gray-50 rounded-lg min-w-24"):
-        ui.label(value).classes(f"text-2xl font-bold {color_class}")
+        value = ui.label().classes(f"text-2xl font-bold {color_class}").mark(f"stat-{label.lower()}")
         ui.label(label).classes("text-sm text-gray-600 mt-1")
+    return value
 
 
-def load_todo_list(container: ui.column):
-    """Load and display todo list."""
+def load_todo_list(
+    todo_cards: dict[int, TodoCard],
+    on_toggle: TodoHandler,
+    on_delete: TodoHandler,
+) -> Optional[ui.column]:
+    """Load and display the first page of the todo list. Returns the column of todo cards."""
+    todo_cards.clear()
     try:
-        todos = TodoService.get_all_todos()
+        # Fetch one extra row to know whether another page exists
+        todos = TodoService.get_all_todos(limit=TODO_PAGE_SIZE + 1)
 
-        with container:
+        with ui.column().classes("gap-3 w-full") as list_column:
             if not todos:
                 with ui.card().classes("p-8 text-center bg-gray-50 rounded-xl"):
                     ui.icon("task_alt", size="3rem").classes("text-gray-400 mb-2")
                     ui.label("No todos yet").classes("text-xl text-gray-500 mb-1")
                     ui.label("Add your first todo above to get started!").classes("text-gray-400")
             else:
-                for todo in todos:
-                    create_todo_item(todo)
+                for todo in todos[:TODO_PAGE_SIZE]:
+                    todo_cards[todo.id] = create_todo_item(todo, on_toggle, on_delete)
+
+        # The last loaded todo is the cursor for the next page
+        last_loaded = todos[:TODO_PAGE_SIZE][-1] if todos else None
+
+        async def handle_load_more():
+            nonlocal last_loaded
+            if last_loaded is not None:
+                last_loaded = await load_more_todos(
+                    list_column, load_more_button, last_loaded, todo_cards, on_toggle, on_delete
+                )
+
+        load_more_button = ui.button("Load more").props("flat color=primary").classes("self-center")
+        load_more_button.on("click", handle_load_more)
+        load_more_button.set_visibility(len(todos) > TODO_PAGE_SIZE)
+        return list_column
 
     except Exception as e:
         logger.error(f"Error loading todos: {str(e)}")
-        with container:
-            ui.label(f"Error loading todos: {str(e)}").classes("text-red-500")
+        ui.label(f"Error loading todos: {str(e)}").classes("text-red-500")
+        return None
+
+
+async def load_more_todos(
+    list_column: ui.column,
+    load_more_button: ui.button,
+    before: TodoRow,
+    todo_cards: dict[int, TodoCard],
+    on_toggle: TodoHandler,
+    on_delete: TodoHandler,
+) -> TodoRow:
+    """Append the page of todos following `before` to the list and return the new last todo."""
+    # Disabled while the page loads, so a second click cannot fetch the same page again
+    load_more_button.disable()
+    try:
+        todos = await run.io_bound(TodoService.get_all_todos, limit=TODO_PAGE_SIZE + 1, before=before)
 
+        with list_column:
+            for todo in todos[:TODO_PAGE_SIZE]:
+                todo_cards[todo.id] = create_todo_item(todo, on_toggle, on_delete)
 
-def create_todo_item(todo):
-    """Create a single todo item card."""
-    # Different styling for completed vs pending todos
-    card_classes = "p-4 rounded-xl shadow-md hover:shadow-lg transition-shadow"
-    if todo.completed:
-        card_classes += " bg-green-50 border-l-4 border-green-400"
-    else:
-        card_classes += " bg-white border-l-4 border-blue-400"
+        load_more_button.set_visibility(len(todos) > TODO_PAGE_SIZE)
+        return todos[:TODO_PAGE_SIZE][-1] if todos else before
 
-    with ui.card().classes(card_classes):
-        with ui.row().classes("w-full items-start justify-between gap-4"):
-            # Todo content
-            with ui.column().classes("flex-1 gap-2"):
-                # Title with completion styling
-                title_classes = "text-lg font-semibold"
-                if todo.completed:
-                    title_classes += " text-green-700 line-through"
-                else:
-                    title_classes += " text-gray-800"
+    except Exception as e:
+        logger.error(f"Error loading todos: {str(e)}")
+        ui.notify(f"Error loading todos: {str(e)}", type="negative")
+        return before
 
-                ui.label(todo.title).classes(title_classes)
+    finally:
+        load_more_button.enable()
 
-                # Description if present
-                if todo.description:
-                    desc_classes = "text-sm"
-                    if todo.completed:
-                        desc_classes += " text-green-600 line-through"
-                    else:
-                        desc_classes += " text-gray-600"
-                    ui.label(todo.description).classes(desc_classes)
 
-                # Metadata
-                ui.label(f"Created: {todo.created_at[:19].replace('T', ' ')}").classes("text-xs text-gray-400")
+def create_todo_item(
+    todo: TodoRow,
+    on_toggle: Optional[TodoHandler] = None,
+    on_delete: Optional[TodoHandler] = None,
+) -> TodoCard:
+    """Create a single todo item card. Without handlers, the buttons are disabled."""
+    with ui.card().classes(TODO_CARD_BASE_CLASSES) as card:
+        with ui.row().classes("w-full items-start justify-between gap-4"):
+            # Todo content, pre-rendered as a single element instead of a column of labels
+            content = ui.html().classes("flex-1 flex flex-col gap-2")
 
             # Action buttons
             with ui.column().classes("gap-2"):
                 # Toggle completion button
-                toggle_icon = "undo" if todo.completed else "check_circle"
-                toggle_text = "Undo" if todo.completed else "Complete"
-                toggle_color = "orange" if todo.completed else "positive"
-
-                ui.button(icon=toggle_icon, on_click=lambda e, t_id=todo.id: toggle_todo_completion(t_id)).props(
-                    f"color={toggle_color} round size=sm"
-                ).tooltip(toggle_text)
+                with ui.button().props("round size=sm") as toggle_button:
+                    toggle_tooltip = ui.tooltip()
 
                 # Delete button
-                ui.button(icon="delete", on_click=lambda e, t_id=todo.id: delete_todo(t_id)).props(
-                    "color=negative round size=sm"
-                ).tooltip("Delete")
+                delete_button = ui.button(icon="delete").props("color=negative round size=sm")
+                delete_button.tooltip("Delete")
+
+    item = TodoCard(todo, card, content, toggle_button, toggle_tooltip)
+    update_todo_card(item, todo)
+
+    # Handlers get the row currently shown on the card, so they know the state the user acted on
+    if on_toggle is not None:
+        toggle_button.on("click", lambda e: on_toggle(item.todo))
+    else:
+        toggle_button.disable()
+    if on_delete is not None:
+        delete_button.on("click", lambda e: on_delete(item.todo))
+    else:
+        delete_button.disable()
+    return item
+
+
+def update_todo_card(item: TodoCard, todo: TodoRow):
+    """Show a new state on an existing todo card, updating its elements in place."""
+    item.todo = todo
+    # Different styling for completed vs pending todos
+    # Swap only the state classes, keeping the card's own and the shared ones
+    item.card.classes(remove=TODO_CARD_CLASSES[not todo.completed], add=TODO_CARD_CLASSES[todo.completed])
+    item.content.set_content(render_todo_html(todo))
 
+    toggle_icon, toggle_color, toggle_text = TODO_TOGGLE_BUTTON[todo.completed]
+    item.toggle_button.props(f"icon={toggle_icon} color={toggle_color}")
+    item.toggle_tooltip.set_text(toggle_text)
+
+
+def render_todo_html(todo: TodoRow) -> str:
+    """Render the title, description and metadata of a todo as one HTML snippet."""
+    # Title with completion styling
+    parts = [f'<div class="{TODO_TITLE_CLASSES[todo.completed]}">{escape(todo.title)}</div>']
+
+    # Description if present
+    if todo.description:
+        parts.append(f'<div class="{TODO_DESCRIPTION_CLASSES[todo.completed]}">{escape(todo.description)}</div>')
+
+    # Metadata
+    parts.append(f'<div class="text-xs text-gray-400">Created: {todo.created_display}</div>')
+    return "".join(parts)
+
+
+async def toggle_todo_completion(todo: TodoRow, todo_cards: dict[int, TodoCard]) -> bool:
+    """Toggle todo completion, updating its card before the change is saved. Returns True if toggled."""
+    item = todo_cards.get(todo.id)
+    toggled = todo._replace(completed=not todo.completed)
+    if item is not None:
+        update_todo_card(item, toggled)
 
-def toggle_todo_completion(todo_id: int):
-    """Toggle todo completion and refresh display."""
     try:
-        result = TodoService.toggle_todo_completion(todo_id)
-        if result:
-            status = "completed" if result.completed else "reopened"
-            ui.notify(f"Todo {status}!", type="positive")
-            # Refresh page to show changes
-            ui.navigate.reload()
-        else:
+        result = await run.io_bound(TodoService.toggle_todo_completion, todo.id)
+        if result is None:
             ui.notify("Todo not found", type="warning")
+            # The todo is gone, so drop its card
+            item = todo_cards.pop(todo.id, None)
+            if item is not None:
+                item.card.delete()
+            return False
+
+        status = "completed" if result.completed else "reopened"
+        ui.notify(f"Todo {status}!", type="positive")
+
+        # Reconcile with the saved state, which differs if the todo was toggled elsewhere meanwhile
+        if item is not None and result.completed != toggled.completed:
+            update_todo_card(item, toggled._replace(completed=result.completed))
+        return True
 
     except Exception as e:
         logger.error(f"Error updating todo: {str(e)}")
         ui.notify(f"Error updating todo: {str(e)}", type="negative")
+        # Roll back the optimistic update
+        if item is not None:
+            update_todo_card(item, todo)
+        return False
 
 
-def delete_todo(todo_id: int):
-    """Delete todo and refresh display."""
+async def delete_todo(todo: TodoRow, todo_cards: dict[int, TodoCard]) -> bool:
+    """Delete todo, hiding its card before the change is saved. Returns True if deleted."""
+    item = todo_cards.get(todo.id)
+    if item is not None:
+        item.card.set_visibility(False)
+
     try:
-        success = TodoService.delete_todo(todo_id)
+        success = await run.io_bound(TodoService.delete_todo, todo.id)
         if success:
             ui.notify("Todo deleted!", type="warning")
-            # Refresh page to show changes
-            ui.navigate.reload()
         else:
             ui.notify("Todo not found", type="warning")
 
+        # Either way the todo no longer exists, so remove its card for good
+        item = todo_cards.pop(todo.id, None)
+        if item is not None:
+            item.card.delete()
+        return bool(success)
+
     except Exception as e:
         logger.error(f"Error deleting todo: {str(e)}")
         ui.notify(f"Error deleting todo: {str(e)}", type="negative")
+        # Roll back the optimistic update
+        if item is not None:
+            item.card.set_visibility(True)
+        return False
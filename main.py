@@ -2,6 +2,7 @@ import logging
 import os
 from app.startup import startup
 from nicegui import app, ui
+from nicegui.json import NiceGUIJSONResponse
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -21,6 +22,11 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+# serialize JSON responses of routes registered below with NiceGUI's encoder,
+# which uses orjson where it is installed and falls back to the standard json module
+app.router.default_response_class = NiceGUIJSONResponse
+
+
 @app.get("/health")
 async def health():
     return {"status": "healthy", "service": "nicegui-app"}
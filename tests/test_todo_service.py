@@ -1,7 +1,7 @@
 import pytest
 from app.database import reset_db
 from app.todo_service import TodoService
-from app.models import TodoCreate, TodoUpdate
+from app.models import DISPLAY_DATETIME_FORMAT, TodoCreate, TodoUpdate
 
 
 @pytest.fixture()
@@ -54,6 +54,40 @@ def test_get_all_todos_with_data(clean_db):
     assert todos[1].id == todo1.id
 
 
+def test_get_all_todos_formats_created_at(clean_db):
+    """Test that list rows carry created_at formatted for display."""
+    TodoService.create_todo(TodoCreate(title="Formatted"))
+
+    todo = TodoService.get_all_todos()[0]
+
+    assert todo.created_display == todo.created_at.strftime(DISPLAY_DATETIME_FORMAT)
+
+
+def test_get_all_todos_paginated(clean_db):
+    """Test getting todos one page at a time."""
+    created = [TodoService.create_todo(TodoCreate(title=f"Todo {i}")) for i in range(5)]
+
+    first_page = TodoService.get_all_todos(limit=2)
+    second_page = TodoService.get_all_todos(limit=2, before=first_page[-1])
+    last_page = TodoService.get_all_todos(limit=2, before=second_page[-1])
+
+    # Newest first, without overlap between pages
+    assert [todo.id for todo in first_page] == [created[4].id, created[3].id]
+    assert [todo.id for todo in second_page] == [created[2].id, created[1].id]
+    assert [todo.id for todo in last_page] == [created[0].id]
+
+
+def test_get_all_todos_paginated_after_delete(clean_db):
+    """Test that deleting a loaded todo does not skip rows on the next page."""
+    created = [TodoService.create_todo(TodoCreate(title=f"Todo {i}")) for i in range(4)]
+
+    first_page = TodoService.get_all_todos(limit=2)
+    TodoService.delete_todo(first_page[0].id)
+    second_page = TodoService.get_all_todos(limit=2, before=first_page[-1])
+
+    assert [todo.id for todo in second_page] == [created[1].id, created[0].id]
+
+
 def test_get_todo_by_id_existing(clean_db):
     """Test getting a todo by existing ID."""
     created_todo = TodoService.create_todo(TodoCreate(title="Test Todo"))
@@ -212,3 +246,20 @@ def test_service_handles_none_values_gracefully(clean_db):
 
     result = TodoService.delete_todo(0)
     assert not result
+
+
+def test_get_stats_updates_after_writes(clean_db):
+    """Test that cached stats are invalidated by writes."""
+    assert TodoService.get_stats()["total"] == 0
+
+    todo = TodoService.create_todo(TodoCreate(title="Todo 1"))
+    assert TodoService.get_stats() == {"total": 1, "completed": 0, "pending": 1}
+
+    TodoService.toggle_todo_completion(todo.id)
+    assert TodoService.get_stats() == {"total": 1, "completed": 1, "pending": 0}
+
+    TodoService.update_todo(todo.id, TodoUpdate(completed=False))
+    assert TodoService.get_stats() == {"total": 1, "completed": 0, "pending": 1}
+
+    TodoService.delete_todo(todo.id)
+    assert TodoService.get_stats() == {"total": 0, "completed": 0, "pending": 0}